@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2025 Joe Pitt
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""On-disk ETag cache for conditional HTTP requests."""
+
+from json import dump as json_dump, load as json_load
+from os import makedirs
+from os.path import expanduser, join
+from threading import Lock
+from typing import Any, Dict, Tuple
+
+from requests import Session
+
+from .functions import json_loads
+
+_CACHE_DIR = expanduser("~/.cache/get_latest_version")
+_CACHE_FILE = join(_CACHE_DIR, "etags.json")
+_LOCK = Lock()
+
+
+def load() -> Dict[str, Dict[str, Any]]:
+    """Load the ETag cache from disk.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The cached entries, keyed by URL, or an empty
+            cache if none exists or it cannot be read.
+    """
+
+    try:
+        with open(_CACHE_FILE, encoding="utf-8") as cache_file:
+            return json_load(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save(cache: Dict[str, Dict[str, Any]]) -> None:
+    """Save the ETag cache to disk, ignoring failures.
+
+    Args:
+        cache (Dict[str, Dict[str, Any]]): The cached entries, keyed by URL.
+    """
+
+    try:
+        makedirs(_CACHE_DIR, exist_ok=True)
+        with open(_CACHE_FILE, "w", encoding="utf-8") as cache_file:
+            json_dump(cache, cache_file)
+    except OSError:
+        pass
+
+
+_CACHE = load()
+
+
+def conditional_get(
+    session: Session, url: str, *, headers: Dict[str, str], timeout: int = 30
+) -> Tuple[Any, Dict[str, Dict[str, str]]]:
+    """GET a URL, reusing the cached body when the server replies 304 Not Modified.
+
+    If the URL has been fetched before, its cached ETag is sent as If-None-Match;
+    on a 304 the cached body is returned without re-transferring it, otherwise the
+    cache is refreshed from the response.
+
+    Args:
+        session (Session): The session to issue the request with.
+        url (str): The URL to fetch.
+        headers (Dict[str, str]): The headers to send with the request.
+        timeout (int, optional): The request timeout in seconds. Defaults to 30.
+
+    Raises:
+        HTTPError: If communication with the server fails.
+
+    Returns:
+        Tuple[Any, Dict[str, Dict[str, str]]]: The parsed JSON body and the parsed
+            Link header of the response (both cached on a 304).
+    """
+
+    with _LOCK:
+        entry = _CACHE.get(url)
+    request_headers = dict(headers)
+    if entry is not None:
+        request_headers["If-None-Match"] = entry["etag"]
+
+    response = session.get(url, headers=request_headers, timeout=timeout)
+    if response.status_code == 304 and entry is not None:
+        return entry["body"], entry["links"]
+    response.raise_for_status()
+
+    body = json_loads(response.content)
+    etag = response.headers.get("ETag")
+    if etag is not None:
+        with _LOCK:
+            _CACHE[url] = {"etag": etag, "body": body, "links": response.links}
+            save(_CACHE)
+    return body, response.links
@@ -0,0 +1,234 @@
+# SPDX-FileCopyrightText: 2025 Joe Pitt
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""Async variants of the version fetchers, built on aiohttp.
+
+These coroutines overlap the TCP/TLS round-trips for many pages (and many
+packages) on a single event loop. They require the optional aiohttp dependency,
+installable as get_latest_version[async].
+"""
+
+from asyncio import Semaphore, gather
+from typing import Any, Dict, List, Literal, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from semver import Version
+
+from . import __version__
+from .functions import json_loads
+from .github import _auth_headers, _latest_from_candidates
+
+_CONCURRENCY = 8
+
+
+def _client_session(headers: Optional[Dict[str, str]] = None) -> ClientSession:
+    """Create a ClientSession with pooling, a timeout and the shared User-Agent.
+
+    Args:
+        headers (Dict[str, str], optional): Extra headers to send with every
+            request. Defaults to None.
+
+    Returns:
+        ClientSession: The configured session.
+    """
+
+    session_headers = {"User-Agent": f"Python get_latest_version/v{__version__}"}
+    if headers is not None:
+        session_headers.update(headers)
+    return ClientSession(
+        connector=TCPConnector(limit=16),
+        headers=session_headers,
+        timeout=ClientTimeout(total=30),
+    )
+
+
+async def _fetch_pages(session: ClientSession, url_template: str) -> List[Any]:
+    """Fetch every page of a paginated GitHub endpoint with bounded concurrency.
+
+    Args:
+        session (ClientSession): The session to issue requests with.
+        url_template (str): The endpoint URL, with a ``{page}`` placeholder.
+
+    Raises:
+        ClientResponseError: If communication with GitHub fails.
+
+    Returns:
+        List[Any]: The parsed JSON body of each page.
+    """
+
+    semaphore = Semaphore(_CONCURRENCY)
+
+    async def fetch(page: int) -> Any:
+        async with semaphore:
+            async with session.get(url_template.format(page=page)) as response:
+                response.raise_for_status()
+                return await response.json(loads=json_loads)
+
+    async with session.get(url_template.format(page=1)) as response:
+        response.raise_for_status()
+        first = await response.json(loads=json_loads)
+        last = response.links.get("last")
+    if last is None:
+        return [first]
+    last_page = int(parse_qs(urlparse(str(last["url"])).query)["page"][0])
+    if last_page < 2:
+        return [first]
+    rest = await gather(*(fetch(page) for page in range(2, last_page + 1)))
+    return [first, *rest]
+
+
+async def aget_latest_version_from_package(  # pylint: disable=too-many-arguments
+    token: str,
+    owner: str,
+    package_name: str,
+    package_type: Literal[
+        "npm", "maven", "rubygems", "docker", "nuget", "container"
+    ] = "container",
+    *,
+    greater_equal_version: Optional[Version] = None,
+    less_than_version: Optional[Version] = None,
+) -> str:
+    """Get the latest version from a GitHub package.
+
+    Args:
+        token (str): The token to authenticate to GitHub with.
+        owner (str): The owner of the package.
+        package_name (str): The name of the package to query.
+        package_type (Literal[npm, maven, rubygems, docker, nuget, container ], optional):
+            The type of package to query. Defaults to "container".
+        greater_equal_version (Version, optional): The minimum version to accept. Defaults to None.
+        less_than_version (Version, optional): The version to accept versions less than.
+            Defaults to None.
+
+    Raises:
+        ClientResponseError: If communication with GitHub fails.
+        ValueError: If no semantic versions could be found.
+
+    Returns:
+        str: The latest version of the package.
+    """
+
+    async with _client_session(_auth_headers(token)) as session:
+        pages = await _fetch_pages(
+            session,
+            f"https://api.github.com/users/{owner}/packages/{package_type}/{package_name}/versions"
+            "?per_page=100&page={page}",
+        )
+    candidates: List[Tuple[str, Tuple[Optional[str], ...]]] = []
+    for page in pages:
+        for version in page:
+            if package_type == "container":
+                for tag in version["metadata"]["container"]["tags"]:
+                    candidates.append((tag, (tag,)))
+            else:
+                candidates.append((version["name"], (version["name"],)))
+    return _latest_from_candidates(
+        candidates, greater_equal_version, less_than_version
+    )
+
+
+async def aget_latest_version_from_releases(
+    token: str,
+    owner: str,
+    repository: str,
+    *,
+    greater_equal_version: Optional[Version] = None,
+    less_than_version: Optional[Version] = None,
+) -> str:
+    """Get the latest version from the releases in a GitHub repository.
+
+    Args:
+        token (str): The token to authenticate to GitHub API with.
+        owner (str): The owner of the source repository.
+        repository (str): The name of the source repository.
+        greater_equal_version (Version, optional): The minimum version to accept. Defaults to None.
+        less_than_version (Version, optional): The version to accept versions less than.
+            Defaults to None.
+
+    Raises:
+        ClientResponseError: If communication with GitHub fails.
+        ValueError: If no semantic versions can be found.
+
+    Returns:
+        str: The name of the release of the latest version.
+    """
+
+    async with _client_session(_auth_headers(token)) as session:
+        pages = await _fetch_pages(
+            session,
+            f"https://api.github.com/repos/{owner}/{repository}/releases"
+            "?per_page=100&page={page}",
+        )
+    candidates: List[Tuple[str, Tuple[Optional[str], ...]]] = []
+    for page in pages:
+        for release in page:
+            if release["draft"]:
+                continue
+            candidates.append(
+                (release["tag_name"], (release["name"], release["tag_name"]))
+            )
+    return _latest_from_candidates(
+        candidates, greater_equal_version, less_than_version
+    )
+
+
+async def aget_latest_version_from_tags(
+    token: str,
+    owner: str,
+    repository: str,
+    *,
+    greater_equal_version: Optional[Version] = None,
+    less_than_version: Optional[Version] = None,
+) -> str:
+    """Get the latest version from the tags in a GitHub repository.
+
+    Args:
+        token (str): The token to authenticate to GitHub API with.
+        owner (str): The owner of the source repository.
+        repository (str): The name of the source repository.
+        greater_equal_version (Version, optional): The minimum version to accept. Defaults to None.
+        less_than_version (Version, optional): The version to accept versions less than.
+            Defaults to None.
+
+    Raises:
+        ClientResponseError: If communication with GitHub fails.
+        ValueError: If no semantic versions can be found.
+
+    Returns:
+        str: The tag of the latest version.
+    """
+
+    async with _client_session(_auth_headers(token)) as session:
+        pages = await _fetch_pages(
+            session,
+            f"https://api.github.com/repos/{owner}/{repository}/tags"
+            "?per_page=100&page={page}",
+        )
+    candidates: List[Tuple[str, Tuple[Optional[str], ...]]] = [
+        (tag["name"], (tag["name"],)) for page in pages for tag in page
+    ]
+    return _latest_from_candidates(
+        candidates, greater_equal_version, less_than_version
+    )
+
+
+async def aget_current_module_version(module: str) -> str:
+    """Get the current version of the specified PIP module.
+
+    Args:
+        module (str): The module to check.
+
+    Raises:
+        ClientResponseError: If communication with PyPI fails.
+
+    Returns:
+        str: The current version of the module.
+    """
+
+    async with _client_session({"Accept": "application/json"}) as session:
+        async with session.get(f"https://pypi.org/pypi/{module}/json") as response:
+            response.raise_for_status()
+            body = await response.json(loads=json_loads)
+    return body["info"]["version"]
@@ -4,10 +4,49 @@
 
 """Shared supporting functions."""
 
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
 
+from requests import Session
+from requests.adapters import HTTPAdapter, Retry
 from semver import Version
 
+from . import __version__
+
+# json_loads is re-exported for the fetcher modules; orjson's C decoder is
+# several times faster than the stdlib on typical API payloads.
+try:
+    from orjson import loads as json_loads  # pylint: disable=unused-import
+except ImportError:
+    from json import loads as json_loads  # pylint: disable=unused-import
+
+
+def new_session() -> Session:
+    """Create a Session with connection pooling, retries and the shared User-Agent.
+
+    Reusing a session keeps TCP and TLS state alive between requests, so paginated
+    calls do not pay for a fresh handshake on every page.
+
+    Returns:
+        Session: The configured session.
+    """
+
+    session = Session()
+    session.headers["User-Agent"] = f"Python get_latest_version/v{__version__}"
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]
+            ),
+        ),
+    )
+    return session
+
 
 def clean_version(version: str) -> str:
     """Tidy up a version number for parsing."""
@@ -27,6 +66,85 @@ def clean_version(version: str) -> str:
     )
 
 
+def get_latest_from_many(
+    sources: Iterable[Tuple[str, Callable[..., str], Dict[str, Any]]],
+) -> Dict[str, Union[str, Exception]]:
+    """Run several version fetchers concurrently and collect their results.
+
+    Callers typically query a handful of independent sources to pick a winner;
+    running them in one thread pool makes the wall time that of the slowest
+    source rather than the sum of them all.
+
+    Args:
+        sources (Iterable[Tuple[str, Callable[..., str], Dict[str, Any]]]): Triples
+            of a label for the source, the fetcher to call and the keyword
+            arguments to call it with.
+
+    Returns:
+        Dict[str, Union[str, Exception]]: The result of each fetcher, keyed by
+            label; a source that failed maps to the exception it raised so one
+            bad mirror does not discard the rest.
+    """
+
+    sources = list(sources)
+    results: Dict[str, Union[str, Exception]] = {}
+    if not sources:
+        return results
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = {
+            executor.submit(function, **kwargs): label
+            for label, function, kwargs in sources
+        }
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                results[futures[future]] = error
+    return results
+
+
+def _in_bounds(
+    version: Version,
+    greater_equal_version: Optional[Version],
+    less_than_version: Optional[Version],
+) -> bool:
+    """Check whether a version falls within the optional bounds.
+
+    Args:
+        version (Version): The version to check.
+        greater_equal_version (Optional[Version]): The minimum version to accept.
+        less_than_version (Optional[Version]): The version to accept versions less than.
+
+    Returns:
+        bool: True if the version is acceptable.
+    """
+
+    return (greater_equal_version is None or version >= greater_equal_version) and (
+        less_than_version is None or version < less_than_version
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse(version: str) -> Optional[Version]:
+    """Parse a version string to a semantic version, memoizing the result.
+
+    The same tag and version strings recur across pages and between calls, so
+    caching the outcome (including failures) avoids re-running the parser and
+    re-raising on known-bad strings like "latest".
+
+    Args:
+        version (str): The version string to parse.
+
+    Returns:
+        Optional[Version]: The parsed version, or None if it is not semantic.
+    """
+
+    try:
+        return Version.parse(clean_version(version))
+    except (TypeError, ValueError):
+        return None
+
+
 def find_latest(semantic_versions: Dict[str, Version]) -> str:
     """Find the latest version in the provided list of versions.
 
@@ -40,9 +158,6 @@ def find_latest(semantic_versions: Dict[str, Version]) -> str:
         str: The identifier associated with the latest version.
     """
 
-    semantic_versions = dict(
-        sorted(semantic_versions.items(), key=lambda item: item[1], reverse=True)
-    )
-    if len(semantic_versions) > 0:
-        return list(semantic_versions.keys())[0]
-    raise ValueError("No semantic versions found")
+    if not semantic_versions:
+        raise ValueError("No semantic versions found")
+    return max(semantic_versions.items(), key=itemgetter(1))[0]
@@ -4,13 +4,239 @@
 
 """Get latest version information from GitHub packages and repositories."""
 
-from typing import Any, Dict, List, Literal, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from re import compile as re_compile
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
+from urllib.parse import parse_qs, urlparse
 
 from semver import Version
-from requests import get
 
-from . import __version__
-from .functions import clean_version, find_latest
+from ._etag_cache import conditional_get
+from .functions import _in_bounds, _parse, new_session
+
+_SESSION = new_session()
+# Pin the response format and ask for compressed payloads once, session-wide.
+_SESSION.headers.update(
+    {
+        "Accept": "application/vnd.github+json, application/vnd.github.v3+json;q=0.5",
+        "Accept-Encoding": "gzip",
+    }
+)
+
+# Deliberately looser than the SemVer grammar: clean_version fixes zero-padded
+# components before parsing, so the prefilter must not reject what _parse accepts.
+_SEMVER_RE = re_compile(r"^[vV]?\d+\.\d+\.\d+([-+].*)?$")
+
+
+@lru_cache(maxsize=8)
+def _auth_headers(token: str) -> Dict[str, str]:
+    """Build, and memoize, the authorisation headers for a GitHub token.
+
+    Args:
+        token (str): The token to authenticate to GitHub with.
+
+    Returns:
+        Dict[str, str]: The headers to send with each request.
+    """
+
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _fetch_pages_concurrent(
+    url_template: str, headers: Dict[str, str]
+) -> Iterator[List[Dict[str, Any]]]:
+    """Fetch every page of a paginated GitHub endpoint, pages 2 onwards concurrently.
+
+    The first page is fetched on its own to learn the total page count from the
+    ``Link: rel="last"`` header, then the remaining pages are downloaded in parallel.
+    Each request is conditional, so unchanged pages are served from the ETag cache.
+
+    Args:
+        url_template (str): The endpoint URL, with a ``{page}`` placeholder.
+        headers (Dict[str, str]): The headers to send with each request.
+
+    Raises:
+        HTTPError: If communication with GitHub fails.
+
+    Yields:
+        List[Dict[str, Any]]: The parsed JSON body of each page.
+    """
+
+    body, links = conditional_get(
+        _SESSION, url_template.format(page=1), headers=headers
+    )
+    yield body
+
+    if "last" not in links:
+        return
+    last_page = int(parse_qs(urlparse(links["last"]["url"]).query)["page"][0])
+    if last_page < 2:
+        return
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(
+                conditional_get,
+                _SESSION,
+                url_template.format(page=page),
+                headers=headers,
+            )
+            for page in range(2, last_page + 1)
+        ]
+        for future in futures:
+            page_body, _ = future.result()
+            yield page_body
+
+
+def _page_exhausted(
+    strict_ordering: bool,
+    greater_equal_version: Optional[Version],
+    page_max: Optional[Version],
+) -> bool:
+    """Check whether pagination can stop after a page.
+
+    GitHub returns releases, tags and package versions newest first, so once a
+    whole page sits below the minimum acceptable version, every later page will
+    too and fetching them is wasted work.
+
+    Args:
+        strict_ordering (bool): Whether newest-first ordering may be assumed.
+        greater_equal_version (Optional[Version]): The minimum version to accept.
+        page_max (Optional[Version]): The highest version parsed from the page.
+
+    Returns:
+        bool: True if no later page can contain an acceptable version.
+    """
+
+    return (
+        strict_ordering
+        and greater_equal_version is not None
+        and page_max is not None
+        and page_max < greater_equal_version
+    )
+
+
+def _parse_candidate(options: Tuple[Optional[str], ...]) -> Optional[Version]:
+    """Parse the first usable semantic version among candidate strings.
+
+    Args:
+        options (Tuple[Optional[str], ...]): The version strings to try, in order.
+
+    Returns:
+        Optional[Version]: The first version that parses, or None if none do.
+    """
+
+    for option in options:
+        if option and _SEMVER_RE.match(option):
+            version = _parse(option)
+            if version is not None:
+                return version
+    return None
+
+
+def _latest_from_candidates(
+    candidates: Iterable[Tuple[str, Tuple[Optional[str], ...]]],
+    greater_equal_version: Optional[Version],
+    less_than_version: Optional[Version],
+) -> str:
+    """Filter candidate version strings and return the latest identifier.
+
+    Args:
+        candidates (Iterable[Tuple[str, Tuple[Optional[str], ...]]]): Pairs of an
+            identifier and the version strings to try parsing for it, in order.
+        greater_equal_version (Optional[Version]): The minimum version to accept.
+        less_than_version (Optional[Version]): The version to accept versions less than.
+
+    Raises:
+        ValueError: If no semantic versions could be found.
+
+    Returns:
+        str: The identifier associated with the latest version.
+    """
+
+    best_name: Optional[str] = None
+    best_version: Optional[Version] = None
+    for identifier, options in candidates:
+        semantic_version = _parse_candidate(options)
+        if semantic_version is None:
+            continue
+        if _in_bounds(semantic_version, greater_equal_version, less_than_version) and (
+            best_version is None or semantic_version > best_version
+        ):
+            best_version, best_name = semantic_version, identifier
+    if best_name is None:
+        raise ValueError("No semantic versions found")
+    return best_name
+
+
+def _latest_from_pages(  # pylint: disable=too-many-arguments
+    url_template: str,
+    token: str,
+    extract: Callable[
+        [List[Dict[str, Any]]], Iterator[Tuple[str, Tuple[Optional[str], ...]]]
+    ],
+    *,
+    greater_equal_version: Optional[Version],
+    less_than_version: Optional[Version],
+    strict_ordering: bool,
+) -> str:
+    """Paginate a GitHub endpoint and return the latest acceptable version.
+
+    This is the single hot path shared by the package, release and tag
+    fetchers: concurrent conditional page fetches, regex prefilter, memoized
+    parse, bounds check, running max and the newest-first early exit all live
+    here, with only candidate extraction differing per endpoint.
+
+    Args:
+        url_template (str): The endpoint URL, with a ``{page}`` placeholder.
+        token (str): The token to authenticate to GitHub with.
+        extract (Callable): Yields, for each item on a page, an identifier and
+            the version strings to try parsing for it, in order.
+        greater_equal_version (Optional[Version]): The minimum version to accept.
+        less_than_version (Optional[Version]): The version to accept versions less than.
+        strict_ordering (bool): Assume newest-first ordering and stop paginating
+            once a whole page is below greater_equal_version.
+
+    Raises:
+        HTTPError: If communication with GitHub fails.
+        ValueError: If no semantic versions could be found.
+
+    Returns:
+        str: The identifier associated with the latest version.
+    """
+
+    best_name: Optional[str] = None
+    best_version: Optional[Version] = None
+
+    for page in _fetch_pages_concurrent(url_template, headers=_auth_headers(token)):
+        page_max: Optional[Version] = None
+        for identifier, options in extract(page):
+            semantic_version = _parse_candidate(options)
+            if semantic_version is None:
+                continue
+            if page_max is None or semantic_version > page_max:
+                page_max = semantic_version
+            if _in_bounds(
+                semantic_version, greater_equal_version, less_than_version
+            ) and (best_version is None or semantic_version > best_version):
+                best_version, best_name = semantic_version, identifier
+        if _page_exhausted(strict_ordering, greater_equal_version, page_max):
+            break
+
+    if best_name is None:
+        raise ValueError("No semantic versions found")
+    return best_name
 
 
 def get_latest_version_from_package(  # pylint: disable=too-many-arguments
@@ -23,6 +249,7 @@ def get_latest_version_from_package(  # pylint: disable=too-many-arguments
     *,
     greater_equal_version: Optional[Version] = None,
     less_than_version: Optional[Version] = None,
+    strict_ordering: bool = True,
 ) -> str:
     """Get the latest version from a GitHub package.
 
@@ -35,6 +262,9 @@ def get_latest_version_from_package(  # pylint: disable=too-many-arguments
         greater_equal_version (Version, optional): The minimum version to accept. Defaults to None.
         less_than_version (Version, optional): The version to accept versions less than.
             Defaults to None.
+        strict_ordering (bool, optional): Assume GitHub returns newest versions first
+            and stop paginating once a whole page is below greater_equal_version.
+            Defaults to True.
 
     Raises:
         HTTPError: If communication with GitHub fails.
@@ -44,64 +274,35 @@ def get_latest_version_from_package(  # pylint: disable=too-many-arguments
         str: The latest version of the package.
     """
 
-    semantic_versions: Dict[str, Version] = {}
-
-    page = 1
-    while True:  # pylint: disable=too-many-nested-blocks
-        response = get(
-            f"https://api.github.com/users/{owner}/packages/{package_type}/{package_name}/versions"
-            f"?per_page=100&page={page}",
-            headers={
-                "Authorization": f"Bearer {token}",
-                "User-Agent": f"Python get_latest_version/v{__version__}",
-            },
-            timeout=30,
-        )
-        response.raise_for_status()
-        versions: List[Dict[str, Any]] = response.json()
-
-        if len(versions) == 0:
-            break
-        page = page + 1
-
+    def extract(
+        versions: List[Dict[str, Any]],
+    ) -> Iterator[Tuple[str, Tuple[Optional[str], ...]]]:
         for version in versions:
             if package_type == "container":
                 for tag in version["metadata"]["container"]["tags"]:
-                    try:
-                        semantic_version = Version.parse(clean_version(tag))
-                        if (
-                            greater_equal_version is None
-                            or semantic_version >= greater_equal_version
-                        ) and (
-                            less_than_version is None
-                            or semantic_version < less_than_version
-                        ):
-                            semantic_versions[tag] = semantic_version
-                    except (TypeError, ValueError):
-                        continue
+                    yield tag, (tag,)
             else:
-                try:
-                    semantic_version = Version.parse(clean_version(version["name"]))
-                    if (
-                        greater_equal_version is None
-                        or semantic_version >= greater_equal_version
-                    ) and (
-                        less_than_version is None
-                        or semantic_version < less_than_version
-                    ):
-                        semantic_versions[version["name"]] = semantic_version
-                except (TypeError, ValueError):
-                    continue
-    return find_latest(semantic_versions)
-
-
-def get_latest_version_from_releases(
+                yield version["name"], (version["name"],)
+
+    return _latest_from_pages(
+        f"https://api.github.com/users/{owner}/packages/{package_type}/{package_name}/versions"
+        "?per_page=100&page={page}",
+        token,
+        extract,
+        greater_equal_version=greater_equal_version,
+        less_than_version=less_than_version,
+        strict_ordering=strict_ordering,
+    )
+
+
+def get_latest_version_from_releases(  # pylint: disable=too-many-arguments
     token: str,
     owner: str,
     repository: str,
     *,
     greater_equal_version: Optional[Version] = None,
     less_than_version: Optional[Version] = None,
+    strict_ordering: bool = True,
 ) -> str:
     """Get the latest version from the releases in a GitHub repository.
 
@@ -112,6 +313,9 @@ def get_latest_version_from_releases(
         greater_equal_version (Version, optional): The minimum version to accept. Defaults to None.
         less_than_version (Version, optional): The version to accept versions less than.
             Defaults to None.
+        strict_ordering (bool, optional): Assume GitHub returns newest versions first
+            and stop paginating once a whole page is below greater_equal_version.
+            Defaults to True.
 
     Raises:
         HTTPError: if communication with GitHub fails.
@@ -121,51 +325,32 @@ def get_latest_version_from_releases(
         str: The name of the release of the latest version.
     """
 
-    semantic_versions: Dict[str, Version] = {}
-
-    page = 1
-    while True:
-        response = get(
-            f"https://api.github.com/repos/{owner}/{repository}/releases?per_page=100&page={page}",
-            headers={
-                "Authorization": f"Bearer {token}",
-                "User-Agent": f"Python get_latest_version/v{__version__}",
-            },
-            timeout=30,
-        )
-        response.raise_for_status()
-        releases: List[Dict[str, Any]] = response.json()
-
-        if len(releases) == 0:
-            break
-        page = page + 1
-
+    def extract(
+        releases: List[Dict[str, Any]],
+    ) -> Iterator[Tuple[str, Tuple[Optional[str], ...]]]:
         for release in releases:
-            if release["draft"]:
-                continue
-            try:
-                semantic_version = Version.parse(clean_version(release["name"]))
-            except (TypeError, ValueError):
-                try:
-                    semantic_version = Version.parse(clean_version(release["tag_name"]))
-                except (TypeError, ValueError):
-                    continue
-            if (
-                greater_equal_version is None
-                or semantic_version >= greater_equal_version
-            ) and (less_than_version is None or semantic_version < less_than_version):
-                semantic_versions[release["tag_name"]] = semantic_version
-
-    return find_latest(semantic_versions)
-
-
-def get_latest_version_from_tags(
+            if not release["draft"]:
+                yield release["tag_name"], (release["name"], release["tag_name"])
+
+    return _latest_from_pages(
+        f"https://api.github.com/repos/{owner}/{repository}/releases"
+        "?per_page=100&page={page}",
+        token,
+        extract,
+        greater_equal_version=greater_equal_version,
+        less_than_version=less_than_version,
+        strict_ordering=strict_ordering,
+    )
+
+
+def get_latest_version_from_tags(  # pylint: disable=too-many-arguments
     token: str,
     owner: str,
     repository: str,
     *,
     greater_equal_version: Optional[Version] = None,
     less_than_version: Optional[Version] = None,
+    strict_ordering: bool = True,
 ) -> str:
     """Get the latest version from the tags in a GitHub repository.
 
@@ -176,6 +361,9 @@ def get_latest_version_from_tags(
         greater_equal_version (Version, optional): The minimum version to accept. Defaults to None.
         less_than_version (Version, optional): The version to accept versions less than.
             Defaults to None.
+        strict_ordering (bool, optional): Assume GitHub returns newest versions first
+            and stop paginating once a whole page is below greater_equal_version.
+            Defaults to True.
 
     Raises:
         HTTPError: if communication with GitHub fails.
@@ -185,37 +373,17 @@ def get_latest_version_from_tags(
         str: The tag of the latest version.
     """
 
-    semantic_versions: Dict[str, Version] = {}
-
-    page = 1
-    while True:
-        response = get(
-            f"https://api.github.com/repos/{owner}/{repository}/tags?per_page=100&page={page}",
-            headers={
-                "Authorization": f"Bearer {token}",
-                "User-Agent": f"Python get_latest_version/v{__version__}",
-            },
-            timeout=30,
-        )
-        response.raise_for_status()
-        tags: List[Dict[str, Any]] = response.json()
-
-        if len(tags) == 0:
-            break
-        page = page + 1
-
+    def extract(
+        tags: List[Dict[str, Any]],
+    ) -> Iterator[Tuple[str, Tuple[Optional[str], ...]]]:
         for tag in tags:
-            try:
-                semantic_version = Version.parse(clean_version(tag["name"]))
-                if (
-                    greater_equal_version is None
-                    or semantic_version >= greater_equal_version
-                ) and (
-                    less_than_version is None
-                    or semantic_version < less_than_version
-                ):
-                    semantic_versions[tag["name"]] = semantic_version
-            except (TypeError, ValueError):
-                pass
-
-    return find_latest(semantic_versions)
+            yield tag["name"], (tag["name"],)
+
+    return _latest_from_pages(
+        f"https://api.github.com/repos/{owner}/{repository}/tags?per_page=100&page={{page}}",
+        token,
+        extract,
+        greater_equal_version=greater_equal_version,
+        less_than_version=less_than_version,
+        strict_ordering=strict_ordering,
+    )
@@ -4,16 +4,26 @@
 
 """Get latest version information from PIP module on PyPI."""
 
-from requests import get
+from time import monotonic
+from typing import Dict, Tuple
 
-from . import __version__
+from .functions import json_loads, new_session
+
+_SESSION = new_session()
+_SESSION.headers["Accept"] = "application/json"
+
+_CACHE: Dict[str, Tuple[float, str]] = {}
+_CACHE_TTL = 300  # seconds
 
 
 def get_current_module_version(module: str) -> str:
     """Get the current version of the specified PIP module.
 
+    Results are cached for five minutes, so polling callers only hit PyPI once
+    per module per interval.
+
     Args:
-        package (str): The module to check.
+        module (str): The module to check.
 
     Raises:
         HTTPError: If communication with PyPI fails
@@ -22,14 +32,14 @@ def get_current_module_version(module: str) -> str:
         str: The current version of the module.
     """
 
-    response = get(
-        f"https://pypi.org/pypi/{module}/json",
-        headers={
-            "Accept": "application/json",
-            "User-Agent": f"Python get_latest_version/v{__version__}",
-        },
-        timeout=30,
-    )
+    now = monotonic()
+    cached = _CACHE.get(module)
+    if cached is not None and now - cached[0] < _CACHE_TTL:
+        return cached[1]
+
+    response = _SESSION.get(f"https://pypi.org/pypi/{module}/json", timeout=30)
     response.raise_for_status()
 
-    return response.json()["info"]["version"]
+    version = json_loads(response.content)["info"]["version"]
+    _CACHE[module] = (now, version)
+    return version
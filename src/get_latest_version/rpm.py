@@ -1,120 +1,218 @@
-# SPDX-FileCopyrightText: 2023-2025 Jisc Services Limited
-# SPDX-FileContributor: Joe Pitt
-#
-# SPDX-License-Identifier: GPL-3.0-only
-
-"""Get latest version information from RPM packages."""
-
-from gzip import open as gzip_open
-from io import BytesIO
-from typing import Dict, List, Optional
-
-from defusedxml import ElementTree
-from requests import get, RequestException
-from semver import Version
-
-from . import __version__
-from .functions import clean_version, find_latest
-
-
-def get_latest_from_rpm_repo(
-    mirror_list_url: str,
-    package_name: str,
-    *,
-    package_arch: str = "x86_64",
-    greater_equal_version: Optional[Version] = None,
-    less_than_version: Optional[Version] = None,
-) -> str:
-    """Get the latest available version of an RPM from a dnf/yum repository.
-
-    Args:
-        mirror_list_url (str): The URL to download the mirror list from.
-        package_name (str): The name of the package to check.
-        package_arch (str, optional): The package architecture to check. Defaults to "x86_64".
-        greater_equal_version (Version, optional): The minimum version to accept. Defaults to None.
-        less_than_version (Version, optional): The version to accept versions less than.
-            Defaults to None.
-
-    Returns:
-        str: The latest rpm available in the repository.
-    """
-
-    versions: Dict[str, Version] = {}
-    mirror_urls: List[str] = (
-        get(
-            mirror_list_url,
-            headers={"User-Agent": f"Python get_latest_version/v{__version__}"},
-            timeout=30,
-        )
-        .content.decode("utf-8")
-        .split("\n")
-    )
-    for mirror in mirror_urls:  # pylint: disable=too-many-nested-blocks
-        try:
-            for metadata in ElementTree.fromstring(
-                get(
-                    f"{mirror}repodata/repomd.xml",
-                    headers={"User-Agent": f"Python get_latest_version/v{__version__}"},
-                    timeout=30,
-                ).content.decode("utf-8")
-            ):
-                if (
-                    "type" not in metadata.attrib
-                    or metadata.attrib["type"] != "primary"
-                ):
-                    continue
-                for option in metadata:
-                    if "href" not in option.attrib:
-                        continue
-                    for package_metadata in ElementTree.parse(
-                        gzip_open(
-                            BytesIO(
-                                get(
-                                    f"{mirror}{option.attrib['href']}",
-                                    headers={
-                                        "User-Agent": f"Python get_latest_version/v{__version__}"
-                                    },
-                                    timeout=30,
-                                ).content
-                            )
-                        )
-                    ).getroot():
-                        if (
-                            "type" not in package_metadata.attrib
-                            or package_metadata.attrib["type"] != "rpm"
-                            or package_metadata.findtext(
-                                ".//ns0:name",
-                                namespaces={
-                                    "ns0": "http://linux.duke.edu/metadata/common"
-                                },
-                            )
-                            != package_name
-                            or package_metadata.findtext(
-                                ".//ns0:arch",
-                                namespaces={
-                                    "ns0": "http://linux.duke.edu/metadata/common"
-                                },
-                            )
-                            != package_arch
-                        ):
-                            continue
-                        version_name = package_metadata.find(
-                            ".//ns0:version",
-                            namespaces={"ns0": "http://linux.duke.edu/metadata/common"},
-                        ).get("ver")
-                        version = clean_version(version_name).split(".")
-                        version = Version(
-                            int(version[0]), int(version[1]), int(version[2])
-                        )
-                        if (
-                            greater_equal_version is None
-                            or version >= greater_equal_version
-                        ) and (
-                            less_than_version is None or version < less_than_version
-                        ):
-                            versions[version_name] = version
-            break
-        except RequestException:
-            pass
-
-    return find_latest(versions)
+# SPDX-FileCopyrightText: 2023-2025 Jisc Services Limited
+# SPDX-FileContributor: Joe Pitt
+#
+# SPDX-License-Identifier: GPL-3.0-only
+
+"""Get latest version information from RPM packages."""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from gzip import open as gzip_open
+from typing import List, Optional, Tuple
+
+from defusedxml import ElementTree
+from requests import RequestException, Response
+from semver import Version
+
+from .functions import _in_bounds, _parse, new_session
+
+_SESSION = new_session()
+
+# How many mirrors to race at once; the fastest responder wins.
+_MIRROR_BATCH = 4
+
+# Clark notation ({uri}localname) resolves by direct tag comparison, skipping
+# the ElementPath mini-compiler that namespace-prefixed XPath queries invoke.
+_COMMON = "{http://linux.duke.edu/metadata/common}"
+_PACKAGE = _COMMON + "package"
+_NAME = _COMMON + "name"
+_ARCH = _COMMON + "arch"
+_VERSION = _COMMON + "version"
+
+
+def _scan_primary(
+    response: Response,
+    package_name: str,
+    package_arch: str,
+    greater_equal_version: Optional[Version],
+    less_than_version: Optional[Version],
+) -> Tuple[Optional[str], Optional[Version]]:
+    """Stream one primary metadata file, tracking the best matching version.
+
+    Args:
+        response (Response): The streamed response for a primary.xml.gz file.
+        package_name (str): The name of the package to check.
+        package_arch (str): The package architecture to check.
+        greater_equal_version (Optional[Version]): The minimum version to accept.
+        less_than_version (Optional[Version]): The version to accept versions less than.
+
+    Returns:
+        Tuple[Optional[str], Optional[Version]]: The version string and parsed version
+            of the latest acceptable package, or (None, None) if there is none.
+    """
+
+    best_name: Optional[str] = None
+    best_version: Optional[Version] = None
+    found = False
+    # The payload is a .gz file, not transport compression; make sure urllib3
+    # hands over the raw bytes for gzip to decompress incrementally.
+    response.raw.decode_content = False
+    for _, package_metadata in ElementTree.iterparse(
+        gzip_open(response.raw), events=("end",)
+    ):
+        if package_metadata.tag != _PACKAGE:
+            continue
+        name = package_metadata.find(_NAME)
+        if name is None or name.text != package_name:
+            package_metadata.clear()
+            if found:
+                # Primary metadata is sorted by name, so once past
+                # the package's entries nothing later can match.
+                break
+            continue
+        found = True
+        arch = package_metadata.find(_ARCH)
+        if (
+            package_metadata.attrib.get("type") != "rpm"
+            or arch is None
+            or arch.text != package_arch
+        ):
+            package_metadata.clear()
+            continue
+        version_name = package_metadata.find(_VERSION).get("ver")
+        version = _parse(version_name)
+        if version is None:
+            package_metadata.clear()
+            continue
+        if _in_bounds(version, greater_equal_version, less_than_version) and (
+            best_version is None or version > best_version
+        ):
+            best_version, best_name = version, version_name
+        package_metadata.clear()
+    return best_name, best_version
+
+
+def _best_from_mirror(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    mirror: str,
+    repomd: str,
+    package_name: str,
+    package_arch: str,
+    greater_equal_version: Optional[Version],
+    less_than_version: Optional[Version],
+) -> Tuple[Optional[str], Optional[Version]]:
+    """Find the latest matching package version in one mirror's primary metadata.
+
+    Args:
+        mirror (str): The base URL of the mirror.
+        repomd (str): The content of the mirror's repomd.xml.
+        package_name (str): The name of the package to check.
+        package_arch (str): The package architecture to check.
+        greater_equal_version (Optional[Version]): The minimum version to accept.
+        less_than_version (Optional[Version]): The version to accept versions less than.
+
+    Raises:
+        RequestException: If downloading primary metadata fails.
+
+    Returns:
+        Tuple[Optional[str], Optional[Version]]: The version string and parsed version
+            of the latest acceptable package, or (None, None) if there is none.
+    """
+
+    best_name: Optional[str] = None
+    best_version: Optional[Version] = None
+    hrefs = [
+        option.attrib["href"]
+        for metadata in ElementTree.fromstring(repomd)
+        if metadata.attrib.get("type") == "primary"
+        for option in metadata
+        if "href" in option.attrib
+    ]
+    if not hrefs:
+        return best_name, best_version
+    with ThreadPoolExecutor(max_workers=len(hrefs)) as executor:
+        futures = [
+            executor.submit(_SESSION.get, f"{mirror}{href}", timeout=10, stream=True)
+            for href in hrefs
+        ]
+        for future in futures:
+            response = future.result()
+            response.raise_for_status()
+            name, version = _scan_primary(
+                response,
+                package_name,
+                package_arch,
+                greater_equal_version,
+                less_than_version,
+            )
+            if version is not None and (best_version is None or version > best_version):
+                best_version, best_name = version, name
+    return best_name, best_version
+
+
+def get_latest_from_rpm_repo(
+    mirror_list_url: str,
+    package_name: str,
+    *,
+    package_arch: str = "x86_64",
+    greater_equal_version: Optional[Version] = None,
+    less_than_version: Optional[Version] = None,
+) -> str:
+    """Get the latest available version of an RPM from a dnf/yum repository.
+
+    Mirrors are raced in small batches: the repomd.xml of several mirrors is
+    requested concurrently and the first one to respond is used, so a slow or
+    dead mirror no longer serialises its full timeout before the next is tried.
+
+    Args:
+        mirror_list_url (str): The URL to download the mirror list from.
+        package_name (str): The name of the package to check.
+        package_arch (str, optional): The package architecture to check. Defaults to "x86_64".
+        greater_equal_version (Version, optional): The minimum version to accept. Defaults to None.
+        less_than_version (Version, optional): The version to accept versions less than.
+            Defaults to None.
+
+    Returns:
+        str: The latest rpm available in the repository.
+    """
+
+    best_name: Optional[str] = None
+    mirror_urls: List[str] = [
+        mirror
+        for mirror in _SESSION.get(mirror_list_url, timeout=30)
+        .content.decode("utf-8")
+        .split("\n")
+        if mirror
+    ]
+    with ThreadPoolExecutor(max_workers=_MIRROR_BATCH) as executor:
+        for batch_start in range(0, len(mirror_urls), _MIRROR_BATCH):
+            batch = mirror_urls[batch_start : batch_start + _MIRROR_BATCH]
+            futures = {
+                executor.submit(
+                    _SESSION.get, f"{mirror}repodata/repomd.xml", timeout=10
+                ): mirror
+                for mirror in batch
+            }
+            done = False
+            for future in as_completed(futures):
+                try:
+                    response = future.result()
+                    response.raise_for_status()
+                    best_name, _ = _best_from_mirror(
+                        futures[future],
+                        response.content.decode("utf-8"),
+                        package_name,
+                        package_arch,
+                        greater_equal_version,
+                        less_than_version,
+                    )
+                    done = True
+                    break
+                except RequestException:
+                    continue
+            if done:
+                for future in futures:
+                    future.cancel()
+                break
+
+    if best_name is None:
+        raise ValueError("No semantic versions found")
+    return best_name